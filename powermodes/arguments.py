@@ -32,29 +32,15 @@ Module contents
 """
 
 from __future__ import annotations
-from argparse import ArgumentParser, Namespace
 from dataclasses import dataclass
 from enum import Enum
-from importlib.metadata import version, PackageNotFoundError
+from functools import cache
 from sys import argv
-from textwrap import dedent
-from typing import NoReturn, Optional
+from types import SimpleNamespace
+from typing import Optional
 
 from .error import Error, ErrorType, handle_error_append
 
-class _ArgumentError(Exception):
-    """The type of exception raised by :class:`_CustomParser`."""
-
-class _CustomParser(ArgumentParser):
-    """Custom ``argparse.ArgumentParser`` to avoid printing errors before
-    :func:`~powermodes.error.handle_error` is called.
-    """
-    def error(self: _CustomParser, message: str) -> NoReturn:
-        """Function overridden not to print errors. An :class:`_ArgumentError` is raised
-        instead.
-        """
-        raise _ArgumentError(message)
-
 class Action(Enum):
     """
     The action the user wants to perform, specified in the command-line arguments.
@@ -74,6 +60,17 @@ class Action(Enum):
     VALIDATE = 4
     """Validate configuration file."""
 
+    # Private names aren't enum members. Keyed by member name, as members can't be used in the
+    # class body.
+    __KEYS: dict[str, list[str]] = {
+        'SHOW_HELP':    [ '-h', '--help' ],
+        'SHOW_VERSION': [       '--version' ],
+        'INTERACTIVE':  [ '-i', '--interactive' ],
+        'APPLY_MODE':   [ '-m', '--mode' ],
+        'VALIDATE':     [ '-v', '--validate' ]
+    }
+    """Command-line arguments associated with each action. See :meth:`to_key`."""
+
     def to_key(self) -> list[str]:
         """Get the command-line arguments associatied with an action. This is used for more
         understandable error messages.
@@ -88,14 +85,23 @@ class Action(Enum):
             ['-h', '--help']
         """
 
-        match self:
-            case Action.SHOW_HELP:    return [ '-h', '--help' ]
-            case Action.SHOW_VERSION: return [       '--version' ]
-            case Action.INTERACTIVE:  return [ '-i', '--interactive' ]
-            case Action.APPLY_MODE:   return [ '-m', '--mode' ]
-            case Action.VALIDATE:     return [ '-v', '--validate' ]
+        return self.__KEYS[self.name]
 
-@dataclass
+__ACTION_KEY_STRINGS: dict[Action, str] = \
+    { action: ' / '.join(action.to_key()) for action in Action }
+"""Command-line arguments associated with each action, formatted for error messages (e.g.:
+``'-h / --help'``).
+"""
+
+__FLAG_ACTIONS: dict[str, Action] = { key: action for action in Action \
+                                      if action != Action.APPLY_MODE \
+                                      for key in action.to_key() }
+"""Associates command-line flags (options without values) with their actions."""
+
+__NO_CONFIG_ACTIONS: frozenset[Action] = frozenset({ Action.SHOW_HELP, Action.SHOW_VERSION })
+"""Actions that don't require a configuration file."""
+
+@dataclass(slots=True)
 class Arguments:
     """Parsed and validated command-line arguments, whose data has been carefully placed in this
     dataclass. See :func:`validate_arguments`.
@@ -118,38 +124,21 @@ class Arguments:
     mode: Optional[str]
     """Powermode to be applied for :attr:`Action.APPLY_MODE`."""
 
-def __create_parser() -> ArgumentParser:
-    """Creates an ``ArgumentParser`` for parsing powermodes' arguments."""
-
-    parser = _CustomParser(prog='powermodes',
-                           description='Linux power consumption manager',
-                           add_help=False,
-                           allow_abbrev=False
-                          )
-
-    parser.add_argument('-h', '--help', dest='actions', action='append_const',
-        const=Action.SHOW_HELP)
-    parser.add_argument('--version', dest='actions', action='append_const',
-        const=Action.SHOW_VERSION)
-    parser.add_argument('-i', '--interactive', dest='actions', action='append_const',
-        const=Action.INTERACTIVE)
-    parser.add_argument('-v', '--validate', dest='actions', action='append_const',
-        const=Action.VALIDATE)
-
-    parser.add_argument('-c', '--config', action='append')
-    parser.add_argument('-m', '--mode', action='append')
-
-    return parser
+__VALUE_OPTIONS: dict[str, str] = { '-c': 'config', '--config': 'config',
+                                    '-m': 'mode',   '--mode': 'mode' }
+"""Associates command-line options that take a value with the ``SimpleNamespace`` attribute where
+their values are stored. See :func:`parse_arguments`.
+"""
 
 def parse_arguments(args: Optional[list[str]] = None) -> \
-    tuple[Optional[Namespace], Optional[Error]]:
+    tuple[Optional[SimpleNamespace], Optional[Error]]:
     """Parses command-line arguments.
 
     :param args: Command-line arguments to parse. Defaults to ``sys.argv``. Note that, when
                  providing a list of custom arguments, the first one will be ignored (name of the
                  program).
 
-    :return: An ``argparse.Namespace`` with the following variables:
+    :return: A ``types.SimpleNamespace`` with the following variables:
              - ``action: Optional[list[Action]]`` - List of actions the user wants to perform
                                                     (includes repetition of actions and excludes
                                                     :attr:`Action.APPLY_MODE`).
@@ -165,34 +154,89 @@ def parse_arguments(args: Optional[list[str]] = None) -> \
         # Keep in mind that handle_error is not to be used in non-user-facing code.
 
         >>> handle_error(parse_arguments(['powermodes']))
-        Namespace(actions=None, config=None, mode=None)
+        namespace(actions=None, config=None, mode=None)
         # Action.SHOW_HELP is set by validate_arguments().
 
         >>> handle_error(parse_arguments(['powermodes', '--help', '-h']))
-        Namespace(actions=[Action.SHOW_HELP, Action.SHOW_HELP], config=None, mode=None)
+        namespace(actions=[Action.SHOW_HELP, Action.SHOW_HELP], config=None, mode=None)
 
         >>> handle_error(parse_arguments(['powermodes', '-h', '-v', '-i']))
-        Namespace(actions=[Action.SHOW_HELP, Action.VALIDATE, Action.INTERACTIVE ], \\
+        namespace(actions=[Action.SHOW_HELP, Action.VALIDATE, Action.INTERACTIVE ], \\
             config=None, mode=None)
 
         >>> handle_error(parse_arguments(['powermodes', '-c', '1.toml', '-c', '2.toml']))
-        Namespace(actions=None, config=['1.toml', '2.toml'], mode=None)
+        namespace(actions=None, config=['1.toml', '2.toml'], mode=None)
 
         >>> handle_error(parse_arguments(['powermodes', '-m' , 'powersave']))
-        Namespace(actions=None, config=None, mode=['powersave'])
+        namespace(actions=None, config=None, mode=['powersave'])
         # Action.APPLY_MODE is set by validate_arguments().
     """
 
-    try:
-        if args is None:
-            args = argv
+    if args is None:
+        args = argv
+
+    parsed = SimpleNamespace(actions=None, config=None, mode=None)
+    remaining = args[:0:-1] # Reversed (and without the program's name), to pop arguments in order
+    while remaining:
+        error = __parse_argument(parsed, remaining)
+        if error is not None:
+            return (None, error)
 
-        parser = __create_parser()
-        return (parser.parse_args(args[1:]), None)
-    except _ArgumentError as ex:
-        return (None, Error(ErrorType.ERROR, str(ex)))
+    return (parsed, None)
+
+def __parse_argument(parsed: SimpleNamespace, remaining: list[str]) -> Optional[Error]:
+    """Parses the next command-line argument. Auxiliary function for :func:`parse_arguments`.
+
+    :param parsed: Arguments parsed so far, that **will be modified**.
+    :param remaining: Arguments yet to be parsed, **in reverse order**. The argument and the value
+                      of its option (if any) are popped from this list.
+    :return: An error, if the argument isn't valid.
+    """
+
+    argument = remaining.pop()
+    if argument.startswith('--'):
+        option, equals, value = argument.partition('=')
+        if equals:
+            if option not in __VALUE_OPTIONS:
+                return Error(ErrorType.ERROR, f'Option {option} doesn\'t take a value.')
+            remaining.append(value)
+
+        return __parse_option(parsed, option, remaining)
+    elif argument.startswith('-') and argument != '-':
+        # Group of short options (e.g.: -ic config.toml). Only the last one can take a value.
+        for i in range(1, len(argument)):
+            error = __parse_option(parsed, '-' + argument[i],
+                                   remaining if i == len(argument) - 1 else [])
+            if error is not None:
+                return error
+
+        return None
+    else:
+        return Error(ErrorType.ERROR, f'Unexpected argument "{argument}".')
 
-def __get_action(parsed_args: Namespace) -> tuple[Optional[Action], Optional[Error]]:
+def __parse_option(parsed: SimpleNamespace, option: str, remaining: list[str]) -> Optional[Error]:
+    """Stores a command-line option in ``parsed``. Auxiliary function for :func:`parse_arguments`.
+
+    :param parsed: Arguments parsed so far, that **will be modified**.
+    :param option: Name of the option (e.g.: ``'-c'`` or ``'--config'``).
+    :param remaining: Arguments yet to be parsed, **in reverse order**. If the option takes a value,
+                      it's popped from this list.
+    :return: An error, if the option is unknown or its value is missing.
+    """
+
+    if option in __FLAG_ACTIONS:
+        parsed.actions = (parsed.actions or []) + [ __FLAG_ACTIONS[option] ]
+    elif option not in __VALUE_OPTIONS:
+        return Error(ErrorType.ERROR, f'Unknown option {option}.')
+    elif not remaining:
+        return Error(ErrorType.ERROR, f'Missing value for option {option}.')
+    else:
+        dest = __VALUE_OPTIONS[option]
+        setattr(parsed, dest, (getattr(parsed, dest) or []) + [ remaining.pop() ])
+
+    return None
+
+def __get_action(parsed_args: SimpleNamespace) -> tuple[Optional[Action], Optional[Error]]:
     """Gets the action the user wants to perform, from the command-line arguments they specified.
     This function is also responsible for considering the action to be :attr:`Action.SHOW_HELP`
     when no action is specified, and :attr:`Action.APPLY_MODE` when at least a powermode is
@@ -213,27 +257,25 @@ def __get_action(parsed_args: Namespace) -> tuple[Optional[Action], Optional[Err
     if parsed_args.actions is None:
         return (Action.SHOW_HELP, None)
 
-    match len(parsed_args.actions):
-        case 1:
-            return (parsed_args.actions[0], None)
-        case _:
-            unique_actions = list(set(parsed_args.actions))
-
-            # Different warning if the user specifies the same action more than once.
-            if len(unique_actions) == 1:
-                option_string = ' / '.join(unique_actions[0].to_key())
-                return (unique_actions[0], \
-                        Error(ErrorType.WARNING, f'Multiple instances of {option_string} option.'))
-
-            # Error if multiple actions are specified
-            options = map(Action.to_key, unique_actions)
-            options_strings = map(' / '.join, options)
-            options_strings_lines = '\n'.join(options_strings)
-            return (None, Error(ErrorType.ERROR, \
-                'Multiple actions specified in command-line arguments:\n' + options_strings_lines))
-
-def __get_config(action: Optional[Action], parsed_args: Namespace) -> \
-    tuple[Optional[Namespace], list[Error]]:
+    if len(parsed_args.actions) == 1:
+        return (parsed_args.actions[0], None)
+
+    # dict.fromkeys keeps the order in which actions were specified, unlike a set
+    unique_actions = list(dict.fromkeys(parsed_args.actions))
+
+    # Different warning if the user specifies the same action more than once.
+    if len(unique_actions) == 1:
+        option_string = __ACTION_KEY_STRINGS[unique_actions[0]]
+        return (unique_actions[0], \
+                Error(ErrorType.WARNING, f'Multiple instances of {option_string} option.'))
+
+    # Error if multiple actions are specified
+    options_strings_lines = '\n'.join(map(__ACTION_KEY_STRINGS.__getitem__, unique_actions))
+    return (None, Error(ErrorType.ERROR, \
+        'Multiple actions specified in command-line arguments:\n' + options_strings_lines))
+
+def __get_config(action: Optional[Action], parsed_args: SimpleNamespace) -> \
+    tuple[Optional[str], list[Error]]:
     """Gets the configuration file (``-c`` / ``--config``) from ``parsed_args`` (if specified).
 
     :param action: Target action from the parsed arguments (see :func:`__get_action`).
@@ -249,7 +291,7 @@ def __get_config(action: Optional[Action], parsed_args: Namespace) -> \
     config = None
 
     if not parsed_args.config:
-        if action not in [ None, Action.SHOW_HELP, Action.SHOW_VERSION ]:
+        if action is not None and action not in __NO_CONFIG_ACTIONS:
             errors.append(Error(ErrorType.ERROR, 'No config file specified.'))
     else:
         match len(parsed_args.config):
@@ -260,12 +302,12 @@ def __get_config(action: Optional[Action], parsed_args: Namespace) -> \
                     'Choosing the last one.'))
                 config = parsed_args.config[-1]
 
-    if config is not None and action in [ Action.SHOW_HELP, Action.SHOW_VERSION ]:
+    if config is not None and action in __NO_CONFIG_ACTIONS:
         errors.append(Error(ErrorType.WARNING, 'Unnecessarily specified config file.'))
 
     return (config, errors)
 
-def __get_mode(parsed_args: Namespace) -> tuple[Optional[str], Optional[Error]]:
+def __get_mode(parsed_args: SimpleNamespace) -> tuple[Optional[str], Optional[Error]]:
     """Gets the powermode (``-m`` / ``--mode``) specified in ``parsed_args``.
 
     :param parsed_args: Parsed command-line arguments (see :func:`parse_arguments`).
@@ -283,7 +325,7 @@ def __get_mode(parsed_args: Namespace) -> tuple[Optional[str], Optional[Error]]:
                       'Choosing the last one.')
         return (parsed_args.mode[-1], error)
 
-def validate_arguments(parsed_args: Namespace) -> tuple[Optional[Arguments], list[Error]]:
+def validate_arguments(parsed_args: SimpleNamespace) -> tuple[Optional[Arguments], list[Error]]:
     """Validates parsed command-line arguments, creating an organized data structure containing
     them in the process.
 
@@ -359,40 +401,47 @@ def parse_validate_arguments(args: Optional[list[str]] = None) -> \
     validated = handle_error_append(errors, validate_arguments(parsed))
     return (validated, errors)
 
-def get_help_message() -> str:
-    """Gets the help message to be shown to the user.
+__HELP_MESSAGE = '''usage: powermodes [options]
 
-    :return: A custom help message string with examples.
-    """
+options:
+  -h, --help                 show this help message
+  --version                  show powermode\'s version
+
+  -c CONFIG, --config CONFIG use CONFIG file
 
-    # Custom help message, due to lack of control from argparse
-    return dedent('''
-                     usage: powermodes [options]
+  -i, --interactive          interactively choose power mode
+  -v, --validate             validate CONFIG file
+  -m MODE, --mode MODE       apply power MODE from CONFIG
 
-                     options:
-                       -h, --help                 show this help message
-                       --version                  show powermode\'s version
+examples:
 
-                       -c CONFIG, --config CONFIG use CONFIG file
+Interactive mode:       # powermodes -ic config.toml
+Validate configuration: # powermodes -vc config.toml
+Apply power mode:       # powermodes -c config.toml -m performance
+'''
+"""Custom help message, with examples. See :func:`get_help_message`."""
 
-                       -i, --interactive          interactively choose power mode
-                       -v, --validate             validate CONFIG file
-                       -m MODE, --mode MODE       apply power MODE from CONFIG
+def get_help_message() -> str:
+    """Gets the help message to be shown to the user.
 
-                     examples:
+    :return: A custom help message string with examples.
+    """
 
-                     Interactive mode:       # powermodes -ic config.toml
-                     Validate configuration: # powermodes -vc config.toml
-                     Apply power mode:       # powermodes -c config.toml -m performance
-                  '''[1:-1])
+    return __HELP_MESSAGE
 
+@cache
 def get_version_string() -> tuple[Optional[str], Optional[Error]]:
-    """Gets the version string of powermodes, for example, ``'powermodes 1.0'``.
+    """Gets the version string of powermodes, for example, ``'powermodes 1.0'``. The result is
+    cached, as getting it requires searching for powermodes' package metadata.
 
     :return: The version of powermodes along with an empty error list, or :data:`None` and an
              error (``importlib.metadata.version`` failed).
     """
 
+    # Imported here, as importlib.metadata is slow to load and only needed for --version
+    # pylint: disable=import-outside-toplevel
+    from importlib.metadata import version, PackageNotFoundError
+
     try:
         return ('powermodes ' + version('powermodes'), None)
     except PackageNotFoundError:
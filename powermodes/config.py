@@ -31,11 +31,10 @@ Module contents
 """
 
 from collections.abc import Generator
-from tomllib import TOMLDecodeError, load
 from typing import Any, Optional
 
 from .error import Error, ErrorType, handle_error_append
-from .plugin import LoadedPlugins, Plugin, wrapped_validate, wrapped_configure
+from .plugin import FilteredConfig, LoadedPlugins, wrapped_validate, wrapped_configure
 
 ParsedConfig = dict[str, Any]
 """Alias for a configuration file that has been parsed, but not yet validated. There is no
@@ -76,6 +75,10 @@ def load_config(path: str) -> tuple[Optional[ParsedConfig], Optional[Error]]:
         }
     """
 
+    # Imported here, as tomllib is only needed when a configuration file is used
+    # pylint: disable=import-outside-toplevel
+    from tomllib import TOMLDecodeError, load
+
     try:
         with open(path, 'rb') as file:
             return (load(file), None)
@@ -86,7 +89,7 @@ def load_config(path: str) -> tuple[Optional[ParsedConfig], Optional[Error]]:
                                              f'Here\'s the error message:\n{str(ex)}'))
 
 def __remove_plugin_references(config: ValidatedConfig, plugin_name: str, \
-                               blacklist: Optional[list[str]] = None) -> None:
+                               blacklist: Optional[set[str]] = None) -> None:
     """Removes references to a plugin in a configuration. This is used when a plugin's
     configuration is deemed invalid, and powermodes tries to continue without it. This is an
     auxiliary method for :func:`validate_config`.
@@ -94,135 +97,121 @@ def __remove_plugin_references(config: ValidatedConfig, plugin_name: str, \
     :param config: :data:`ValidatedConfig` (partially validated configuration) that
                    **will be modified**.
     :param plugin_name: Name of the plugin that will be removed from ``config``.
-    :param blacklist: List of names of powermodes from which the plugin references must not be
+    :param blacklist: Set of names of powermodes from which the plugin references must not be
                       removed. Usually, these are the powermodes for which the plugin's
                       :attr:`~powermodes.plugin.Plugin.validate` method reported success.
     """
 
     if blacklist is None:
-        blacklist = []
+        blacklist = set()
 
     for mode, mode_config in config.items():
-        for name_key in list(mode_config):
-            if name_key == plugin_name and mode not in blacklist:
-                del mode_config[name_key]
+        if mode not in blacklist:
+            mode_config.pop(plugin_name, None)
 
-def __validate_remove_non_dicts(config: ParsedConfig) -> tuple[None, list[Error]]:
-    """Removes all non-dictionary powermodes from a configuration. This is an auxiliary method
-    for :func:`validate_config`.
+# pylint: disable=too-many-locals,too-many-branches
+def __validate_powermodes(config: ParsedConfig, plugins: LoadedPlugins) \
+    -> tuple[dict[str, list[str]], list[Error]]:
+    """Removes non-dictionary and empty powermodes, along with configurations for unknown plugins,
+    from a configuration. All of these are found in a single pass over the configuration. This is
+    an auxiliary method for :func:`validate_config`.
 
     :param config: Configuration that **may be modified**. After calling this method, it can
                    type-wise be considered a :data:`ValidatedConfig`, even if only partially
                    validated.
-    :return: Warnings reported the non-dictionaries that were removed.
+    :param plugins: Loaded plugins (see :func:`~powermodes.plugin.load_plugins`).
+    :return: A dictionary associating the names of the (known) plugins used in the configuration
+             file with the powermodes where they're configured, along with warnings for removed
+             powermodes and unknown plugins.
     """
 
     errors: list[Error] = []
+    known: dict[str, list[str]] = {} # plugin -> list of powermodes where its defined
+    unknown: dict[str, list[str]] = {} # plugin -> list of powermodes where its defined
+    only_unknown: list[str] = [] # powermodes that will be empty after removing unknown plugins
+    invalid: list[str] = [] # non-dictionary and empty powermodes
 
-    for mode in list(config):
-        if not isinstance(config[mode], dict):
+    for mode, mode_config in config.items():
+        if not isinstance(mode_config, dict):
             errors.append(Error(ErrorType.WARNING, 'Config specified invalid powermode ' \
                                                   f'"{mode}". Must be a TOML table. Ignoring it.'))
-            del config[mode]
-
-    return (None, errors)
-
-def __validate_remove_empty_dicts(config: ValidatedConfig, results_from_removal: bool) \
-    -> tuple[None, list[Error]]:
-    """Removes empty dictionaries (powermodes) from a configuration. This is an auxiliary method
-    for :func:`validate_config`.
-
-    :param config: Partially validated (:data:`ValidatedConfig`) configuration that **may be
-                   modified** (on error).
-    :param results_from_removal: Whether any empty dictionary (powermode) may have been modified
-                                 before, by removing invalidly configured plugins (:data:`True`),
-                                 or if the powermode was already empty in the user's configuration
-                                 file (:data:`False`). Changing this parameter only influences
-                                 eventual error messages.
-    :return: Warnings for removed powermodes.
-    """
-
-    errors: list[Error] = []
-
-    for mode in list(config):
-        if not config[mode]:
-            if results_from_removal:
-                errors.append(Error(ErrorType.WARNING, f'Empty powermode "{mode}", resulting ' \
-                                                        'the removal of invalid configuration ' \
-                                                        'parts. Ignoring it.'))
-            else:
-                errors.append(Error(ErrorType.WARNING, 'Config specified empty powermode ' \
-                                                      f'"{mode}". Ignoring it.'))
-
-            del config[mode]
-
-    return (None, errors)
-
-# pylint: disable=too-many-locals
-def __validate_remove_unknown_plugins(config: ValidatedConfig, plugins: LoadedPlugins) \
-    -> tuple[set[str], list[Error]]:
-    """Removes all unknown plugins from a configuration. This is an auxiliary method for
-    :func:`validate_config`.
+            invalid.append(mode)
+        elif not mode_config:
+            errors.append(Error(ErrorType.WARNING, 'Config specified empty powermode ' \
+                                                  f'"{mode}". Ignoring it.'))
+            invalid.append(mode)
+        else:
+            has_known = False
+            for plugin in mode_config:
+                if plugin in plugins:
+                    known.setdefault(plugin, []).append(mode)
+                    has_known = True
+                else:
+                    unknown.setdefault(plugin, []).append(mode)
 
-    :param config: Partially validated configuration that **may be modified**.
-    :param plugins: Loaded plugins (see :func:`~powermodes.plugin.load_plugins`).
-    :return: A set of the names of the plugins used in the configuration file, along with warnings
-             for all unknown plugins.
-    """
+            if not has_known:
+                only_unknown.append(mode)
 
-    errors: list[Error] = []
-    known: set[str] = set()
-    unknown: dict[str, list[str]] = {} # plugin -> list of powermodes where its defined
+    for mode in invalid:
+        del config[mode]
 
-    for mode in config.keys():
-        for plugin in config[mode].keys():
-            if plugin in plugins:
-                known.add(plugin)
-            else:
-                if plugin in unknown:
-                    unknown[plugin].append(mode)
-                else:
-                    unknown[plugin] = [ mode ]
+    errors.extend(Error(ErrorType.WARNING, f'Unknown plugin {plugin} will be ignored in the ' \
+                                           f'following powermodes: {", ".join(modes)}') \
+                  for plugin, modes in unknown.items())
 
     for plugin, modes in unknown.items():
-        modes_text = ', '.join(modes)
-        errors.append(Error(ErrorType.WARNING, f'Unknown plugin {plugin} will be ignored in the ' \
-                                               f'following powermodes: {modes_text}'))
-        __remove_plugin_references(config, plugin)
+        for mode in modes:
+            del config[mode][plugin]
+
+    for mode in only_unknown:
+        errors.append(Error(ErrorType.WARNING, f'Empty powermode "{mode}", resulting the ' \
+                                                'removal of invalid configuration parts. ' \
+                                                'Ignoring it.'))
+        del config[mode]
 
     return (known, errors)
 
-def __validate_plugins(config: ValidatedConfig, plugins: set[Plugin]) -> \
-    tuple[None, list[Error]]:
+def __validate_plugins(config: ValidatedConfig, plugins: LoadedPlugins,
+                       plugin_modes: dict[str, list[str]]) -> tuple[None, list[Error]]:
     """Calls the :attr:`~powermodes.plugin.Plugin.validate` method for every plugin present in a
     configuration, removing plugin configurations in case configuration errors are reported by
-    plugins. This is an auxiliary method for :func:`validate_config`.
+    plugins. Powermodes left empty by these removals are also removed. This is an auxiliary method
+    for :func:`validate_config`.
 
     :param config: Partially validated configuration (:data:`ValidatedConfig`) that
                    **may be modified** (on error).
-    :param plugins: Plugins present in the configuration file
-                    (see :func:`__validate_remove_unknown_plugins`).
-    :return: Warnings from plugins.
+    :param plugins: Loaded plugins (see :func:`~powermodes.plugin.load_plugins`).
+    :param plugin_modes: Plugins present in the configuration file, associated with the powermodes
+                         where they're configured (see :func:`__validate_powermodes`). Only these
+                         plugins are validated.
+    :return: Warnings from plugins, and for removed powermodes.
     """
 
     errors: list[Error] = []
 
-    for plugin in plugins:
+    for plugin_name, modes in plugin_modes.items():
+        plugin = plugins[plugin_name]
         successful = handle_error_append(errors, wrapped_validate(plugin, config))
 
-        error_modes: list[str] = \
-            list(filter(lambda mode, suc=successful, name=plugin.name, cfg=config: # type: ignore
-                        name in cfg[mode] and mode not in suc,
-                        config.keys()))
+        successful_set = set(successful)
+        error_modes = [ mode for mode in modes if mode not in successful_set ]
 
         if len(error_modes) != 0:
-            errors.append(Error(ErrorType.WARNING, f'Removing plugin {plugin.name} from the ' \
-                                                    'following powermodes: ' + \
-                                                    ', '.join(error_modes) + '. Plugin\'s ' \
-                                                    'validate method failed.',
-                                plugin.name))
+            error_modes_text = ', '.join(error_modes)
+            errors.append(Error(ErrorType.WARNING, f'Removing plugin {plugin_name} from the ' \
+                                                   f'following powermodes: {error_modes_text}. ' \
+                                                    'Plugin\'s validate method failed.',
+                                plugin_name))
 
-        __remove_plugin_references(config, plugin.name, successful)
+        __remove_plugin_references(config, plugin_name, successful_set)
+
+    # Only done after all plugins are validated, so that the result doesn't depend on their order
+    empty_modes = [ mode for mode, mode_config in config.items() if not mode_config ]
+    for mode in empty_modes:
+        errors.append(Error(ErrorType.WARNING, f'Empty powermode "{mode}", resulting the ' \
+                                                'removal of invalid configuration parts. ' \
+                                                'Ignoring it.'))
+        del config[mode]
 
     return (None, errors)
 
@@ -235,9 +224,10 @@ def validate_config(config: ParsedConfig, plugins: LoadedPlugins) -> tuple[bool,
     - Empty powermodes are removed;
     - Configurations for unknown (not installed) plugins are removed;
     - Plugins' ``validate`` methods are called, to remove invalidly configured parts from
-      powermodes;
-    - Empty powermodes are removed again (these may result from previous deletion of invalid
-      parts).
+      powermodes.
+
+    Powermodes left empty by the removal of invalid parts are also removed. The first three
+    checks are performed in a single pass over the configuration.
 
     :param config: Parsed configuration file (see :func:`load_config`). **Will be modified** and
                    will become an :data:`ValidatedConfig`.
@@ -249,13 +239,8 @@ def validate_config(config: ParsedConfig, plugins: LoadedPlugins) -> tuple[bool,
 
     errors: list[Error] = []
 
-    handle_error_append(errors, __validate_remove_non_dicts(config))
-    handle_error_append(errors, __validate_remove_empty_dicts(config, False))
-    known_plugin_names = \
-        handle_error_append(errors, __validate_remove_unknown_plugins(config, plugins))
-    known_plugins = set(map(plugins.__getitem__, known_plugin_names))
-    handle_error_append(errors, __validate_plugins(config, known_plugins))
-    handle_error_append(errors, __validate_remove_empty_dicts(config, True))
+    plugin_modes = handle_error_append(errors, __validate_powermodes(config, plugins))
+    handle_error_append(errors, __validate_plugins(config, plugins, plugin_modes))
 
     if not config:
         errors.append(Error(ErrorType.ERROR, 'Empty configuration (this may be the result ' \
@@ -301,7 +286,7 @@ def apply_mode(mode: str, config: ValidatedConfig, plugins: LoadedPlugins) -> \
     else:
         return (True, errors)
 
-def plugin_is_in_all_powermodes(config: ValidatedConfig, plugin_name: str) -> \
+def plugin_is_in_all_powermodes(config: FilteredConfig, plugin_name: str) -> \
     tuple[bool, Optional[Error]]:
     """Checks if all powermodes have a configuration object for a given plugin. This is useful for
     plugins that store state on the operating system (e.g.: CPU frequency limits), where having a
@@ -312,33 +297,32 @@ def plugin_is_in_all_powermodes(config: ValidatedConfig, plugin_name: str) -> \
     as acknowledgment from the user that they are aware of the problem relating to stored operating
     system state.
 
-    :param config: A :data:`ValidatedConfig`.
+    :param config: A :data:`ValidatedConfig`, or the
+                   :data:`~powermodes.plugin.FilteredConfig` a plugin receives.
     :param plugin_name: Name of the plugin to check for presence in all powermodes.
     :return: Whether or not the plugin is configured in every powermode, along with a warning for
              all powermodes that don't configure the plugin.
     """
 
-    not_in: list[str] = []
-    for powermode, powermode_config in config.items():
-        if plugin_name not in powermode_config:
-            not_in.append(powermode)
-
-    if len(not_in) == 0:
+    # all() stops at the first missing powermode. The full list is only built for the warning.
+    if all(plugin_name in powermode_config for powermode_config in config.values()):
         return (True, None)
     else:
-        not_in_list = ', '.join(not_in)
+        not_in_list = ', '.join(powermode for powermode, powermode_config in config.items() \
+                                          if plugin_name not in powermode_config)
         return (False, Error(ErrorType.WARNING, 'Not all powermodes have a configuration for ' \
                                                f'{plugin_name}. That means that you may get a ' \
                                                 'partially configured system while hopping ' \
                                                 'between modes. Here are the missing ' \
                                                f'powermodes: {not_in_list}.' ))
 
-def iterate_config(config: ValidatedConfig, plugin_name: str) \
+def iterate_config(config: FilteredConfig, plugin_name: str) \
     -> Generator[tuple[str, Any], None, None]:
     """Iterates through a configuration file, through all powermodes, and returns tuples
     containing the name of the current powermode, and the configuration object for the plugin.
 
-    :param config: :data:`ValidatedConfig` to iterate through.
+    :param config: :data:`ValidatedConfig` (or :data:`~powermodes.plugin.FilteredConfig`) to
+                   iterate through.
     :param plugin_name: Name of the plugin that the returned configuration objects will configure.
     :return: Iterates through tuples, containing powermodes' names and configuration objects for
              the plugin.
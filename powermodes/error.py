@@ -96,6 +96,7 @@ Module contents
 from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum
+from functools import cache, lru_cache
 import sys
 from typing import Any, NoReturn, Optional, Union
 
@@ -105,7 +106,7 @@ class ErrorType(Enum):
     WARNING = 0 #: A non-fatal error.
     ERROR = 1   #: A fatal (although, possibly not immediately fatal) error.
 
-@dataclass
+@dataclass(slots=True)
 class Error:
     """An error / warning that can be reported by powermodes."""
 
@@ -124,6 +125,53 @@ class Error:
     before printing the errors.
     """
 
+__ERROR_PREFIXES: dict[ErrorType, str] = \
+    { ErrorType.WARNING: 'warning: ', ErrorType.ERROR: 'error: ' }
+"""Text printed before an error's message, for each type of error."""
+
+__ERROR_COLORS: dict[ErrorType, str] = \
+    { ErrorType.WARNING: '\033[33m', ErrorType.ERROR: '\033[31m' }
+"""Terminal color of each type of error (only used when ``sys.stderr`` is a terminal)."""
+
+@cache
+def __stderr_isatty() -> bool:
+    """Checks if ``sys.stderr`` is a terminal. The result is cached, so that printing multiple
+    errors doesn't require a system call for each one.
+
+    :return: Whether ``sys.stderr`` is a terminal.
+    """
+
+    return sys.stderr.isatty()
+
+@lru_cache(maxsize=32)
+def __error_affixes(origin: Optional[str], error_type: ErrorType) -> tuple[str, str]:
+    """Builds the text that comes before and after the message of a formatted error. Results are
+    cached, as many errors usually share the same origin and type.
+
+    :param origin: :attr:`Error.origin` of the error.
+    :param error_type: :attr:`Error.error_type` of the error.
+    :return: The prefix and the suffix of the formatted message (see :func:`__format_error`).
+    """
+
+    prefix = __ERROR_PREFIXES[error_type]
+    if origin is not None:
+        prefix = f'{origin} {prefix}'
+
+    if __stderr_isatty():
+        return (f'{__ERROR_COLORS[error_type]}{prefix}', '\033[39m')
+    else:
+        return (prefix, '')
+
+def __format_error(err: Error) -> str:
+    """Formats an error for printing. See :func:`print_error`.
+
+    :param err: Error to be formatted.
+    :return: The formatted error message, colored if ``sys.stderr`` is a terminal.
+    """
+
+    prefix, suffix = __error_affixes(err.origin, err.error_type)
+    return f'{prefix}{err.message}{suffix}'
+
 def print_error(err: Error) -> None:
     """Prints a powermodes' error to ``sys.stderr``. The message will be formated and, if
     ``sys.stderr`` is a terminal (the output isn't being piped), the message will be outputted in
@@ -145,18 +193,7 @@ def print_error(err: Error) -> None:
         origin warning: warning message
     """
 
-    print_str = ''
-    if err.origin is not None:
-        print_str = err.origin + ' '
-
-    print_str += 'warning: ' if err.error_type == ErrorType.WARNING else 'error: '
-    print_str += err.message
-
-    if sys.stderr.isatty():
-        color = '\033[33m' if err.error_type == ErrorType.WARNING else '\033[31m'
-        print_str = color + print_str + '\033[39m'
-
-    print(print_str, file=sys.stderr)
+    sys.stderr.write(__format_error(err) + '\n')
 
 def handle_error(output: tuple[Optional[Any], Union[Error, list[Error], None]]) -> \
     Union[Any, NoReturn]:
@@ -207,11 +244,19 @@ def handle_error(output: tuple[Optional[Any], Union[Error, list[Error], None]])
     has_errors = False
     if isinstance(err, Error):
         print_error(err)
-        has_errors = err.error_type == ErrorType.ERROR
+        has_errors = err.error_type is ErrorType.ERROR
     elif isinstance(err, list):
+        # Errors are checked for fatality while being formatted, and printed in a single write,
+        # instead of one for each error
+        lines = []
         for error in err:
-            print_error(error)
-        has_errors = any(map(lambda e: e.error_type == ErrorType.ERROR, err))
+            lines.append(__format_error(error) + '\n')
+            if error.error_type is ErrorType.ERROR:
+                has_errors = True
+
+        if lines:
+            sys.stderr.write(''.join(lines))
+            sys.stderr.flush()
     else:
         has_errors = False
 
@@ -259,13 +304,17 @@ def handle_error_append(lst: list[Error], \
         # result = None and errors = [ example_error, example_warning1, example_warning2 ].
     """
 
-    obj, err = output
+    # Fast path for the common case of no errors
+    err = output[1]
+    if err is None:
+        return output[0]
+
     if isinstance(err, Error):
         lst.append(err)
     elif isinstance(err, list):
         lst.extend(err)
 
-    return obj
+    return output[0]
 
 def set_unspecified_origins(errors: list[Error], origin: str) -> None:
     """Sets the origins of errors whose :attr:`Error.origin` is :data:`None`. Used to set the
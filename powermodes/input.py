@@ -28,7 +28,7 @@ Module contents
 
 from collections.abc import Iterable
 from typing import Any
-from sys import maxsize, stderr
+from sys import maxsize, stderr, stdout
 
 def input_integer(bottom: int = -maxsize - 1, top: int = maxsize,
                   prompt: str ='{bottom} - {top} > ', \
@@ -64,16 +64,23 @@ def input_integer(bottom: int = -maxsize - 1, top: int = maxsize,
         # 7
     """
 
+    prompt = prompt.format(bottom=bottom, top=top)
+    error = error.format(bottom=bottom, top=top)
+
     while True:
-        string_input = input(prompt.format(bottom=bottom, top=top))
-        try:
-            int_input = int(string_input)
-            if bottom <= int_input <= top:
-                return int_input
-            else:
-                raise ValueError()
-        except ValueError:
-            print(error.format(bottom=bottom, top=top), file=stderr)
+        string_input = input(prompt).strip()
+
+        # Input is checked before calling int, so that most invalid input doesn't raise an exception
+        digits = string_input[1:] if string_input[:1] in ('+', '-') else string_input
+        if digits.isdigit():
+            try:
+                int_input = int(string_input)
+                if bottom <= int_input <= top:
+                    return int_input
+            except ValueError: # Digits int doesn't accept (e.g.: superscripts)
+                pass
+
+        print(error, file=stderr)
 
 def print_options(options: Iterable[str],
                   message: str ='Choose an option:', line_format: str ='  ({n}) - {opt}') -> None:
@@ -99,11 +106,10 @@ def print_options(options: Iterable[str],
           (3) - Charlie
     """
 
-    print(message, end='\n')
-    count = 1
-    for option in options:
-        print(line_format.format(n=count, opt=option))
-        count += 1
+    format_line = line_format.format
+    lines = [ message ]
+    lines.extend(format_line(n=n, opt=option) for n, option in enumerate(options, 1))
+    stdout.write('\n'.join(lines) + '\n')
 
 def choose_option(options: list[tuple[Any, str]], \
                   message: str ='Choose an option:', line_format: str ='  ({n}) - {opt}', \
@@ -111,7 +117,7 @@ def choose_option(options: list[tuple[Any, str]], \
                   error: str = 'Input must be an integer between {bottom} and {top}!') -> Any:
     """Asks the user to choose an item from a list of options, by inputting a number. Like
     :func:`input_integer`, this function will keep trying to read input until a valid integer is
-    read.
+    read. If there's only one option, it's returned without asking the user.
 
     :param options: A list of tuples, the options the user will choose from. The first tuple
                     element is the object that will be returned if the user chooses that option.
@@ -148,6 +154,9 @@ def choose_option(options: list[tuple[Any, str]], \
         # '192.168.1.2'
     """
 
+    if len(options) == 1:
+        return options[0][0]
+
     print_options(map(lambda t: t[1], options), message, line_format)
     index = input_integer(1, len(options), prompt, error) - 1
     return options[index][0]
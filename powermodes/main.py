@@ -22,15 +22,18 @@ powermodes.main
 Module that contains powermode's entry point, :func:`main`.
 """
 
+from __future__ import annotations
 from os import getuid
 import sys
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from .arguments import Action, parse_validate_arguments, get_help_message, get_version_string
-from .config import ValidatedConfig, load_config, validate_config, apply_mode
 from .error import Error, ErrorType, handle_error, handle_error_append
-from .input import choose_option
-from .plugin import LoadedPlugins,  load_plugins
+
+# Only imported for type annotations. At runtime, these modules are imported when needed.
+if TYPE_CHECKING:
+    from .config import ValidatedConfig
+    from .plugin import LoadedPlugins
 
 def __assert_root() -> tuple[None, Optional[Error]]:
     """Checks if the user running powermodes has root priveleges. This is a hard requirement for a
@@ -53,27 +56,30 @@ def __format_version() -> tuple[str, list[Error]]:
              powermodes' version, or from loading plugins.
     """
 
+    # Imported here, to reduce startup time for actions that don't need plugins
+    # pylint: disable=import-outside-toplevel
+    from .plugin import load_plugins
+
     errors: list[Error] = []
     version = handle_error_append(errors, get_version_string())
     plugins = handle_error_append(errors, load_plugins())
 
-    message = ''
+    message: list[str] = []
 
     if version is not None:
-        message += f'\n{version}\n'
+        message.append(f'\n{version}\n')
 
     if len(plugins) != 0:
-        message += '\nVersions of installed plugins:\n'
+        message.append('\nVersions of installed plugins:\n')
 
         sorted_plugins = list(plugins.values())
         sorted_plugins.sort(key = lambda p: p.name)
         name_max_length = max(map(lambda p: len(p.name), sorted_plugins))
 
-        for plugin in sorted_plugins:
-            spaces = ' ' * (name_max_length + 1 - len(plugin.name))
-            message += plugin.name + spaces + plugin.version + '\n'
+        message.extend(f'{plugin.name.ljust(name_max_length + 1)}{plugin.version}\n' \
+                       for plugin in sorted_plugins)
 
-    return (message, errors)
+    return (''.join(message), errors)
 
 def __load_config_plugins(path: str) -> \
     tuple[Optional[tuple[ValidatedConfig, LoadedPlugins]], list[Error]]:
@@ -86,11 +92,18 @@ def __load_config_plugins(path: str) -> \
              may have happened.
     """
 
+    # Imported here, to reduce startup time for actions that don't need configuration files
+    # pylint: disable=import-outside-toplevel
+    from .config import load_config, validate_config
+    from .plugin import load_plugins
+
     errors: list[Error] = []
     config = handle_error_append(errors, load_config(path))
-    plugins = handle_error_append(errors, load_plugins())
+    if config is None:
+        return (None, errors) # Don't load plugins for a configuration that can't be used
 
-    if config is None or plugins is None:
+    plugins = handle_error_append(errors, load_plugins())
+    if plugins is None:
         return (None, errors)
 
     validate_success = handle_error_append(errors, validate_config(config, plugins))
@@ -99,6 +112,30 @@ def __load_config_plugins(path: str) -> \
 
     return ((config, plugins), errors)
 
+def __apply_mode(mode: Optional[str], config: ValidatedConfig, plugins: LoadedPlugins) -> None:
+    """Applies a powermode, exiting powermodes on failure.
+
+    :param mode: Name of the powermode to be applied. If :data:`None`, the user is asked to choose
+                 one interactively.
+    :param config: Validated configuration file (see :func:`__load_config_plugins`).
+    :param plugins: Loaded plugins (see :func:`__load_config_plugins`).
+    """
+
+    # Imported here, to reduce startup time for --help and --version
+    # pylint: disable=import-outside-toplevel
+    from .config import apply_mode
+    from .input import choose_option
+
+    if mode is None:
+        options = [ (name, name) for name in config ]
+        mode = choose_option(options, 'Choose a powermode:')
+        if len(options) == 1:
+            # choose_option doesn't ask the user when there's a single option
+            print(f'Applying the only powermode, "{mode}".')
+
+    success, errors = apply_mode(mode, config, plugins)
+    handle_error((True if success else None, errors))
+
 def main() -> None:
     """The entry point to powermodes"""
     args = handle_error(parse_validate_arguments())
@@ -119,12 +156,7 @@ def main() -> None:
                     sys.exit(0)
 
                 case Action.APPLY_MODE:
-                    success, errors = apply_mode(args.mode, config, plugins)
-                    handle_error((True if success else None, errors))
+                    __apply_mode(args.mode, config, plugins)
 
                 case Action.INTERACTIVE:
-                    options = list(zip(config.keys(), config.keys()))
-                    mode = choose_option(options, 'Choose a powermode:')
-
-                    success, errors = apply_mode(mode, config, plugins)
-                    handle_error((True if success else None, errors))
+                    __apply_mode(None, config, plugins)
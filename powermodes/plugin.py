@@ -37,7 +37,7 @@ To create a plugin, you must define two constants and two methods:
     VERSION: str = '0.1'
 
     # Used to validate a configuration file. Described below.
-    def validate(config: dict[str, dict[str, Any]]) -> tuple[list[str], list[Error]]:
+    def validate(config: FilteredConfig) -> tuple[list[str], list[Error]]:
         ...
 
     # Used to apply a configuration. Also described below.
@@ -51,7 +51,10 @@ Configuration validation
 ^^^^^^^^^^^^^^^^^^^^^^^^
 
 ``validate`` will be called before ``configure``. Its job is to validate a configuration file. The
-object it receives is the full configuration file, filtered not to include data from other plugins,
+object it receives is the full configuration file, filtered not to include data from other plugins
+(a :data:`FilteredConfig`). Its mappings are read-only (trying to modify them results in an
+exception), and your plugin's configuration objects are copies, so modifying them has no effect
+on powermodes' configuration.
 
 For example, in the configuration file from `README <../../../README.md>`_, this is the object that
 ``pluginA`` would receive:
@@ -95,13 +98,17 @@ Module contents
 ^^^^^^^^^^^^^^^
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from copy import deepcopy
 from dataclasses import dataclass
 from importlib import import_module
-from inspect import signature
-from pathlib import Path
+# Needed pylint suppression because inspect defines the CO_* flags dynamically, from dis
+# pylint: disable-next=no-name-in-module
+from inspect import CO_VARARGS, CO_VARKEYWORDS, signature
+from os import scandir
+from os.path import dirname, join
 from traceback import format_exception
+from types import FunctionType, MappingProxyType
 from typing import Any, Optional
 
 from .error import Error, ErrorType, handle_error_append, set_unspecified_origins
@@ -111,10 +118,15 @@ ValidatedConfig = dict[str, dict[str, Any]]
 module imports from :mod:`powermodes.config`.
 """
 
-__plugins_dir = Path(__file__).parent.joinpath('plugins')
+FilteredConfig = Mapping[str, Mapping[str, Any]]
+"""Read-only view of a :data:`ValidatedConfig`, containing only copies of the configuration objects
+of a single plugin. This is what a plugin's :attr:`~Plugin.validate` method receives.
+"""
+
+__plugins_dir = join(dirname(__file__), 'plugins')
 """Path to the directory that contains the plugins."""
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Plugin:
     """The type of a powermodes plugin."""
 
@@ -129,9 +141,9 @@ class Plugin:
     """Version of the plugin (self-reported ``VERSION`` constant, or ``'unknown'``, if ``VERSION``
     isn't set)."""
 
-    validate: Callable[[ValidatedConfig], tuple[list[str], list[Error]]]
+    validate: Callable[[FilteredConfig], tuple[list[str], list[Error]]]
     """Method called to validate the parts of a configuration file related to this plugin. Takes
-    in a filtered :data:`ValidatedConfig` (excludes data from other plugins) and returns the list
+    in a :data:`FilteredConfig` (excludes data from other plugins) and returns the list
     of validly configured powermodes, along with all warnings reported.
 
     **DO NOT USE** unless you *really* know what you're doing. Use :func:`wrapped_validate`
@@ -168,9 +180,9 @@ def __valid_plugin_validate_return(obj: Any) -> bool:
     if not isinstance(obj[0], list) or not isinstance(obj[1], list):
         return False
 
-    if not all(map(lambda e: isinstance(e, str), obj[0])):
+    if not all(isinstance(e, str) for e in obj[0]):
         return False
-    if not all(map(lambda e: isinstance(e, Error), obj[1])):
+    if not all(isinstance(e, Error) for e in obj[1]):
         return False
 
     return True
@@ -195,36 +207,38 @@ def __valid_plugin_configure_return(obj: Any) -> bool:
 
     if not isinstance(obj[1], list):
         return False
-    if not all(map(lambda e: isinstance(e, Error), obj[1])):
+    if not all(isinstance(e, Error) for e in obj[1]):
         return False
 
     return True
 
-def __filter_config_for_plugin(config: ValidatedConfig, plugin_name: str) -> ValidatedConfig:
+def __filter_config_for_plugin(config: ValidatedConfig, plugin_name: str) -> FilteredConfig:
     """Removes configuration objects unrelated to a plugin in a configuration, so that plugins
-    don't have access to data that's not theirs.
+    don't have access to data that's not theirs. The mappings in the result are read-only, and
+    only the plugin's own configuration objects are copied, so that plugins can't modify the
+    configuration either.
 
     :param config: Partially validated configuration (:data:`ValidatedConfig`). It must be
                    certain that all powermodes are dictionaries.
     :param plugin_name: Name of the plugin whose configurations must be kept.
-    :return: The filtered (and deep-copied) configuration.
+    :return: The filtered configuration. Powermodes without a configuration for the plugin are
+             kept as empty mappings, so that plugins can know about them (see
+             :func:`~powermodes.config.plugin_is_in_all_powermodes`).
     """
 
-    copy = deepcopy(config)
-
-    for mode in list(config):
-        for name_key in list(config[mode]):
-            if name_key != plugin_name:
-                del copy[mode][name_key]
-
-    return copy
+    return MappingProxyType({ mode: MappingProxyType({ plugin_name: \
+                                                       deepcopy(mode_config[plugin_name]) } \
+                                                     if plugin_name in mode_config else {}) \
+                              for mode, mode_config in config.items() })
 
 def wrapped_validate(plugin: Plugin, config: ValidatedConfig) -> tuple[list[str], list[Error]]:
     """
     Wrapper around a plugin's :attr:`~Plugin.validate` method. This method performs some checks to
     make sure that the plugin won't crash powermodes:
 
-    - The configuration provided to the plugin is filtered, not to share data about other plugins;
+    - The configuration provided to the plugin is filtered, not to share data about other plugins,
+      and it can't be used to modify the configuration (read-only mappings and copied
+      configuration objects);
     - Exceptions raised by the plugin are handled and transformed into errors;
     - The plugin is forced to return an object of the expected type (deep-check). Otherwise, an
       error is reported;
@@ -308,13 +322,10 @@ def list_plugin_module_names() -> tuple[Optional[list[str]], list[Error]]:
              errors and warnings.
     """
 
-    def is_plugin(path: Path) -> bool:
-        return path.suffix == '.py' and not path.stem.startswith('__')
-
     try:
-        file_paths = Path(__plugins_dir).iterdir()
-        plugin_paths = filter(is_plugin, file_paths)
-        names = map(lambda p: p.stem, plugin_paths)
+        with scandir(__plugins_dir) as entries:
+            names = [ entry.name[:-3] for entry in entries \
+                      if entry.name.endswith('.py') and not entry.name.startswith('__') ]
     except OSError:
         return (None, [ Error(ErrorType.ERROR, 'Failed to list plugins.') ])
 
@@ -330,6 +341,25 @@ def list_plugin_module_names() -> tuple[Optional[list[str]], list[Error]]:
 
     return (valid_names, warnings)
 
+def __count_parameters(function: Callable[..., Any]) -> int:
+    """Counts the parameters of a callable, like ``len(inspect.signature(function).parameters)``.
+    For plain Python functions, the parameters are counted from the function's code object, which
+    is much faster than building a signature. Auxiliary function for :func:`load_plugin`.
+
+    :param function: Callable whose parameters will be counted.
+    :return: The number of parameters of ``function``.
+    """
+
+    # Functions with __wrapped__ or __signature__ have a signature that differs from their code
+    if isinstance(function, FunctionType) and not hasattr(function, '__wrapped__') and \
+        not hasattr(function, '__signature__'):
+
+        code = function.__code__
+        return code.co_argcount + code.co_kwonlyargcount + \
+               bool(code.co_flags & CO_VARARGS) + bool(code.co_flags & CO_VARKEYWORDS)
+
+    return len(signature(function).parameters)
+
 def load_plugin(module_name: str) -> tuple[Optional[Plugin], list[Error]]:
     """Loads a plugin from its module name. Plugin validation is also performed in this method. The
     following checks are performed:
@@ -375,7 +405,7 @@ def load_plugin(module_name: str) -> tuple[Optional[Plugin], list[Error]]:
                                                'plugin.', module.NAME))
         return (None, errors)
 
-    elif not callable(module.validate) or len(signature(module.validate).parameters) != 1:
+    elif not callable(module.validate) or __count_parameters(module.validate) != 1:
 
         errors.append(Error(ErrorType.WARNING, 'validate must be a method that takes in a ' \
                                                'single argument. Considering all config files ' \
@@ -387,7 +417,7 @@ def load_plugin(module_name: str) -> tuple[Optional[Plugin], list[Error]]:
                                                'invalid plugin.', module.NAME))
         return (None, errors)
 
-    elif not callable(module.configure) or len(signature(module.configure).parameters) != 1:
+    elif not callable(module.configure) or __count_parameters(module.configure) != 1:
         errors.append(Error(ErrorType.WARNING, 'configure must be a method that takes in a ' \
                                                'single argument. Ignoring this plugin.', \
                             module.NAME))
@@ -28,10 +28,15 @@ from typing import Any, Optional, Union
 
 from ..config import iterate_config
 from ..error import Error, ErrorType, handle_error_append
+from ..plugin import FilteredConfig
 
 NAME = 'command'
 VERSION = '1.0'
 
+__COMMAND_PROPERTIES: frozenset[str] = frozenset([ 'command', 'allow-stdin', 'show-stdout',
+                                                   'show-stderr', 'warning-on-failure' ])
+"""Properties a command can have. Any other property is reported as unknown."""
+
 @dataclass
 class _Command:
 
@@ -116,8 +121,7 @@ def __command_validate_unknowns(command: dict[str, Any], powermode: str, number:
     :return: A possible reported warning.
     """
 
-    unknown = list(filter(lambda p: p not in [ 'command', 'allow-stdin', 'show-stdout',
-        'show-stderr', 'warning-on-failure' ], command.keys()))
+    unknown = [ p for p in command if p not in __COMMAND_PROPERTIES ]
     if len(unknown) != 0:
         unknown_csv = ', '.join(unknown)
         return (None, Error(ErrorType.WARNING, f'Command number {number} in powermode ' \
@@ -163,7 +167,7 @@ def __command_validate(command: Any, powermode: str, number: int) \
         return (_Command(to_run, allow_stdin, show_stdout, show_stderr, warning_on_failure),
                 errors)
 
-def validate(config: dict[str, dict[str, Any]]) -> tuple[list[str], list[Error]]:
+def validate(config: FilteredConfig) -> tuple[list[str], list[Error]]:
     """See :attr:`powermodes.plugin.Plugin.validate`."""
 
     errors: list[Error] = []
@@ -29,6 +29,7 @@ from typing import Any, Optional, Union
 
 from ..config import iterate_config, plugin_is_in_all_powermodes
 from ..error import Error, ErrorType, handle_error_append
+from ..plugin import FilteredConfig
 from ..pluginutils import write_text_file
 
 NAME = 'intel-epb'
@@ -123,7 +124,7 @@ def __interpret_config_object(obj: Any, powermode: str) -> tuple[Optional[int],
                                                 'or one of the following strings: ' \
                                                f'{accepted_strings}.'))
 
-def validate(config: dict[str, dict[str, Any]]) -> tuple[list[str], list[Error]]:
+def validate(config: FilteredConfig) -> tuple[list[str], list[Error]]:
     """See :attr:`powermodes.plugin.Plugin.validate`."""
 
     global __epb_files
@@ -23,16 +23,17 @@ Plugin to enable / disable the NMI (non-maskable interrupt) watchdog. See how to
 `here <../../../powermodes/plugins/nmiwatchdog.md>`_.
 """
 
-from typing import Any, Union
+from typing import Union
 
 from ..config import iterate_config, plugin_is_in_all_powermodes
 from ..error import Error, ErrorType, handle_error_append
+from ..plugin import FilteredConfig
 from ..pluginutils import write_text_file
 
 NAME = 'nmi-watchdog'
 VERSION = '1.1'
 
-def validate(config: dict[str, dict[str, Any]]) -> tuple[list[str], list[Error]]:
+def validate(config: FilteredConfig) -> tuple[list[str], list[Error]]:
     """See :attr:`powermodes.plugin.Plugin.validate`."""
 
     errors: list[Error] = []